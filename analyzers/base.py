@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class CodeStructure:
     """Data structure representing analyzed code components."""
     classes: List[Dict]
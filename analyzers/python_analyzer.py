@@ -1,4 +1,5 @@
 import ast
+from itertools import chain
 from typing import Dict, List, Optional, Any
 
 from .base import BaseAnalyzer, CodeStructure
@@ -17,21 +18,65 @@ class PythonAnalyzer(BaseAnalyzer):
         Returns:
             CodeStructure containing the analyzed components
         """
-        try:
-            tree = ast.parse(code)
-            visitor = PythonAstVisitor()
-            visitor.visit(tree)
+        return self.analyze_tree(self.parse_code(code))
+
+    def parse_code(self, code: str) -> ast.Module:
+        """
+        Parse Python code into an AST.
+        
+        Callers that also need the tree can parse once and pass it to
+        analyze_tree instead of calling analyze_code.
+        
+        Args:
+            code: Python source code to parse
+            
+        Returns:
+            The parsed module AST
             
-            return CodeStructure(
-                classes=visitor.classes,
-                functions=visitor.functions,
-                imports=visitor.imports,
-                variables=visitor.variables
-            )
+        Raises:
+            ValueError: If the code is not valid Python
+        """
+        try:
+            return ast.parse(code)
         except SyntaxError as e:
             raise ValueError(f"Invalid Python code: {str(e)}")
 
-class PythonAstVisitor(ast.NodeVisitor):
+    def analyze_tree(self, tree: ast.AST) -> CodeStructure:
+        """
+        Extract the code structure from an already parsed AST.
+        
+        Args:
+            tree: Module AST, e.g. from parse_code
+            
+        Returns:
+            CodeStructure containing the analyzed components
+        """
+        visitor = PythonAstVisitor()
+        visitor.visit(tree)
+        
+        return CodeStructure(
+            classes=visitor.classes,
+            functions=visitor.functions,
+            imports=visitor.imports,
+            variables=visitor.variables
+        )
+
+# Nodes that can hold definitions, imports or assignments. Expressions never
+# contain statements, so visitors looking for these need not descend into them.
+STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+class StatementVisitor(ast.NodeVisitor):
+    """AST visitor base that walks statements and skips expression subtrees."""
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit nested statements only, skipping expression subtrees."""
+        for _, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, STATEMENT_NODES):
+                        self.visit(item)
+
+class PythonAstVisitor(StatementVisitor):
     """AST visitor to extract code structure from Python source."""
     
     def __init__(self):
@@ -113,25 +158,13 @@ class PythonAstVisitor(ast.NodeVisitor):
         
     def _get_arguments(self, args: ast.arguments) -> List[str]:
         """Helper to extract function arguments."""
-        arg_list = []
-        
-        # Add positional args
-        for arg in args.posonlyargs + args.args:
-            arg_list.append(arg.arg)
-            
-        # Add varargs if present
-        if args.vararg:
-            arg_list.append(f"*{args.vararg.arg}")
-            
-        # Add keyword args
-        for arg in args.kwonlyargs:
-            arg_list.append(arg.arg)
-            
-        # Add kwargs if present
-        if args.kwarg:
-            arg_list.append(f"**{args.kwarg.arg}")
-            
-        return arg_list
+        return list(chain(
+            (arg.arg for arg in args.posonlyargs),
+            (arg.arg for arg in args.args),
+            (f"*{args.vararg.arg}",) if args.vararg else (),
+            (arg.arg for arg in args.kwonlyargs),
+            (f"**{args.kwarg.arg}",) if args.kwarg else (),
+        ))
         
     def _get_decorator_name(self, decorator: ast.expr) -> str:
         """Helper to extract decorator names."""
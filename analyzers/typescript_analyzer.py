@@ -1,14 +1,16 @@
 import json
+import logging
 import subprocess
 import os
 import shutil
-import tempfile
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 from .base import BaseAnalyzer
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class CodeFunction:
     name: str
     args: List[str] = field(default_factory=list)
@@ -16,31 +18,31 @@ class CodeFunction:
     lineno: int = 0
     is_async: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class CodeMethod:
     name: str
     args: List[str] = field(default_factory=list)
     returns: str = 'void'
     lineno: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CodeClass:
     name: str
     methods: List[CodeMethod] = field(default_factory=list)
     lineno: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CodeImport:
     module: str
     names: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class CodeVariable:
     name: str
     type: str = 'unknown'
     lineno: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CodeStructure:
     classes: List[dict] = field(default_factory=list)
     functions: List[dict] = field(default_factory=list)
@@ -50,6 +52,27 @@ class CodeStructure:
 class TypeScriptAnalyzer(BaseAnalyzer):
     """Analyzer for TypeScript source code using the TypeScript Compiler API."""
 
+    def __init__(self):
+        """
+        Resolve the analyzer script, npx executable and subprocess environment once.
+
+        These do not change between calls, so sharing one analyzer instance
+        avoids repeating the PATH lookup and environment setup per file.
+        """
+        # Determine the project root directory
+        self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        
+        # Find the full path to npx (validated when analyzing)
+        self.npx_path = shutil.which('npx')
+        
+        # Construct the full path to the TypeScript analyzer script
+        self.ts_analyzer_script = os.path.join(self.project_root, 'src', 'ts_code_analyzer.ts')
+        
+        # Prepare environment variables to capture more details
+        self.env = os.environ.copy()
+        self.env['NODE_OPTIONS'] = '--trace-warnings'
+        self.env['TS_NODE_COMPILER_OPTIONS'] = '{"experimentalDecorators":true,"emitDecoratorMetadata":true,"target":"ES5","module":"commonjs","esModuleInterop":true,"skipLibCheck":true,"noResolve":false,"allowSyntheticDefaultImports":true,"moduleResolution":"node","types":["node"],"typeRoots":["./node_modules/@types"],"strict":false,"noImplicitAny":false,"noUnusedLocals":false,"noUnusedParameters":false,"baseUrl":".","paths":{"*":["node_modules/*"]}}'
+
     def analyze_code(self, code: str, file_path: Optional[str] = None) -> CodeStructure:
         """
         Analyze TypeScript code and extract its structure.
@@ -69,121 +92,100 @@ class TypeScriptAnalyzer(BaseAnalyzer):
             raise ValueError("Empty code provided")
 
         try:
-            # Determine the project root directory
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            # Find the full path to npx
-            npx_path = shutil.which('npx')
+            npx_path = self.npx_path
             if not npx_path:
-                print("npx not found in PATH")
+                logger.error("npx not found in PATH")
                 raise ValueError("npx is not installed")
             
-            # Construct the full path to the TypeScript analyzer script
-            ts_analyzer_script = os.path.join(project_root, 'src', 'ts_code_analyzer.ts')
+            ts_analyzer_script = self.ts_analyzer_script
             
             # Verify the script exists
             if not os.path.exists(ts_analyzer_script):
-                print(f"TypeScript analyzer script not found: {ts_analyzer_script}")
+                logger.error("TypeScript analyzer script not found: %s", ts_analyzer_script)
                 raise FileNotFoundError(f"TypeScript analyzer script not found at {ts_analyzer_script}")
             
-            # Create a temporary file to write the code
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ts', delete=False, encoding='utf-8') as temp_file:
-                # Ensure the code is properly formatted
-                formatted_code = code.strip()
-                temp_file.write(formatted_code)
-                temp_file_path = temp_file.name
+            # Ensure the code is properly formatted
+            formatted_code = code.strip()
             
+            # Run the TypeScript analyzer with more comprehensive error handling
+            process = subprocess.Popen(
+                [npx_path, 'ts-node', ts_analyzer_script, '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',  # The analyzer reads stdin and writes stdout as UTF-8
+                cwd=self.project_root,  # Set the working directory to the project root
+                env=self.env
+            )
+            
+            # Send the code to the analyzer over stdin rather than staging it in a temp file
             try:
-                # Prepare environment variables to capture more details
-                env = os.environ.copy()
-                env['NODE_OPTIONS'] = '--trace-warnings'
-                env['TS_NODE_COMPILER_OPTIONS'] = '{"experimentalDecorators":true,"emitDecoratorMetadata":true,"target":"ES5","module":"commonjs","esModuleInterop":true,"skipLibCheck":true,"noResolve":false,"allowSyntheticDefaultImports":true,"moduleResolution":"node","types":["node"],"typeRoots":["./node_modules/@types"],"strict":false,"noImplicitAny":false,"noUnusedLocals":false,"noUnusedParameters":false,"baseUrl":".","paths":{"*":["node_modules/*"]}}'
-                
-                # Run the TypeScript analyzer with more comprehensive error handling
-                process = subprocess.Popen(
-                    [npx_path, 'ts-node', ts_analyzer_script, temp_file_path],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=project_root,  # Set the working directory to the project root
-                    env=env
-                )
-
-                # Send the code to the analyzer
-                try:
-                    stdout, stderr = process.communicate(timeout=30)  # Increased timeout to 30 seconds
-                except subprocess.TimeoutExpired:
-                    # If the process is still running, kill it and get the output
-                    process.kill()
-                    stdout, stderr = process.communicate()
-                    print(f"TypeScript analyzer timed out. Stderr: {stderr}")
-                    raise ValueError(f"TypeScript analyzer timed out. Stderr: {stderr}")
-                
-                # Print out any error output for debugging
+                stdout, stderr = process.communicate(input=formatted_code, timeout=30)  # Increased timeout to 30 seconds
+            except subprocess.TimeoutExpired:
+                # If the process is still running, kill it and get the output
+                process.kill()
+                stdout, stderr = process.communicate()
+                logger.error("TypeScript analyzer timed out. Stderr: %s", stderr)
+                raise ValueError(f"TypeScript analyzer timed out. Stderr: {stderr}")
+            
+            # Log any error output for debugging
+            if stderr:
+                logger.warning("TypeScript parsing stderr: %s", stderr)
+            
+            # Check return code
+            if process.returncode != 0:
+                # If the process fails, raise a ValueError with details
+                error_msg = f"TypeScript parsing failed with return code {process.returncode}"
                 if stderr:
-                    print(f"TypeScript parsing stderr: {stderr}")
-                
-                # Check return code
-                if process.returncode != 0:
-                    # If the process fails, raise a ValueError with details
-                    error_msg = f"TypeScript parsing failed with return code {process.returncode}"
-                    if stderr:
-                        error_msg += f": {stderr}"
-                    raise ValueError(error_msg)
-                
-                # If no output, raise an error
-                if not stdout.strip():
-                    raise ValueError("No output from TypeScript analyzer")
-                
-                # Parse the result
-                try:
-                    result = json.loads(stdout)
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse JSON output: {stdout}")
-                    raise ValueError(f"Invalid JSON output: {e}")
-                
-                # Validate the result structure
-                if not isinstance(result, dict):
-                    raise ValueError(f"Unexpected result type: {type(result)}")
-                
-                # Convert the result to our CodeStructure format
-                return CodeStructure(
-                    classes=[{
-                        'name': cls['name'],
-                        'methods': [{
-                            'name': method['name'],
-                            'args': [arg['name'] for arg in method['args']],
-                            'returns': method['returns'],
-                            'lineno': method['line']
-                        } for method in cls['methods']],
-                        'lineno': cls['line'],
-                    } for cls in result.get('classes', [])],
-                    functions=[{
-                        'name': func['name'],
-                        'args': [arg['name'] for arg in func['args']],
-                        'returns': func['returns'],
-                        'lineno': func['line'],
-                        'is_async': func.get('is_async', False)
-                    } for func in result.get('functions', [])],
-                    imports=[{
-                        'module': imp['module'],
-                        'names': imp['names']
-                    } for imp in result.get('imports', [])],
-                    variables=[{
-                        'name': var['name'],
-                        'type': var.get('type', 'unknown'),
-                        'lineno': var.get('line', 0)
-                    } for var in result.get('variables', [])]
-                )
+                    error_msg += f": {stderr}"
+                raise ValueError(error_msg)
+            
+            # If no output, raise an error
+            if not stdout.strip():
+                raise ValueError("No output from TypeScript analyzer")
+            
+            # Parse the result
+            try:
+                result = json.loads(stdout)
+            except json.JSONDecodeError as e:
+                logger.error("Failed to parse JSON output: %s", stdout)
+                raise ValueError(f"Invalid JSON output: {e}")
+            
+            # Validate the result structure
+            if not isinstance(result, dict):
+                raise ValueError(f"Unexpected result type: {type(result)}")
             
-            finally:
-                # Clean up the temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as cleanup_error:
-                    print(f"Error cleaning up temp file: {cleanup_error}")
+            # Convert the result to our CodeStructure format
+            return CodeStructure(
+                classes=[{
+                    'name': cls['name'],
+                    'methods': [{
+                        'name': method['name'],
+                        'args': [arg['name'] for arg in method['args']],
+                        'returns': method['returns'],
+                        'lineno': method['line']
+                    } for method in cls['methods']],
+                    'lineno': cls['line'],
+                } for cls in result.get('classes', [])],
+                functions=[{
+                    'name': func['name'],
+                    'args': [arg['name'] for arg in func['args']],
+                    'returns': func['returns'],
+                    'lineno': func['line'],
+                    'is_async': func.get('is_async', False)
+                } for func in result.get('functions', [])],
+                imports=[{
+                    'module': imp['module'],
+                    'names': imp['names']
+                } for imp in result.get('imports', [])],
+                variables=[{
+                    'name': var['name'],
+                    'type': var.get('type', 'unknown'),
+                    'lineno': var.get('line', 0)
+                } for var in result.get('variables', [])]
+            )
             
         except (subprocess.SubprocessError, json.JSONDecodeError, OSError) as e:
-            print(f"Error in TypeScript code analysis: {e}")
+            logger.error("Error in TypeScript code analysis: %s", e)
             raise ValueError(f"Failed to analyze TypeScript code: {str(e)}")
\ No newline at end of file
@@ -1,61 +1,192 @@
-from langchain.llms import OpenAI
 from langchain.chat_models import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
+from langchain.schema import HumanMessage, SystemMessage
 from config import config
+from functools import lru_cache
+import hashlib
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _get_chat_model(model_name, temperature):
+    """
+    Return a chat model shared by every wrapper using the same settings.
+    
+    Each ChatOpenAI owns its own HTTP client, so sharing the instance lets
+    wrappers reuse pooled keep-alive connections instead of opening new ones.
+    
+    :param model_name: OpenAI model name
+    :param temperature: Sampling temperature
+    :return: ChatOpenAI instance
+    """
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature
+    )
+
 class LLMWrapper:
-    def __init__(self, provider=None, model_name=None):
+    def __init__(self, provider=None, model_name=None, cache_responses=False):
         """
         Initialize the LLM wrapper with the specified provider and model.
         
         :param provider: LLM provider (default from config)
         :param model_name: Specific model name (default from config)
+        :param cache_responses: Reuse the response for an identical rendered prompt
+            instead of calling the LLM again (default False)
         """
         # Use config values if not explicitly provided
         self.provider = provider or config.LLM_PROVIDER
         self.model_name = model_name or config.LLM_MODEL_NAME
         
+        # Exact-match response cache, keyed by a digest of the rendered prompt
+        self._response_cache = {} if cache_responses else None
+        
         # Set API key from environment or config
         os.environ['OPENAI_API_KEY'] = config.OPENAI_API_KEY
         
         # Initialize the appropriate LLM based on provider
         if self.provider.lower() == 'openai':
-            self.llm = ChatOpenAI(
-                model_name=self.model_name,
-                temperature=0.7  # Adjustable creativity
+            self.llm = _get_chat_model(
+                self.model_name,
+                0.7  # Adjustable creativity
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {self.provider}")
     
-    def generate_response(self, prompt_template, input_variables):
+    def generate_response(self, prompt_template, input_variables, system_prompt=None):
         """
         Generate a response using the specified prompt template.
         
         :param prompt_template: String template for the prompt
         :param input_variables: Dictionary of variables to fill the template
-        :return: Generated response from the LLM
+        :param system_prompt: Optional fixed instructions sent as a separate system
+            message ahead of the prompt, so providers can cache the shared prefix
+        :return: Generated response from the LLM, or None if the prompt is empty or the call fails
         """
         try:
-            # Create a prompt template
-            prompt = PromptTemplate(
-                input_variables=list(input_variables.keys()),
-                template=prompt_template
-            )
+            # Render the prompt directly; the templates are plain format strings
+            prompt = prompt_template.format(**input_variables)
+            if not prompt.strip():
+                logger.error("Empty LLM prompt; not sending it")
+                return None
             
-            # Create an LLM chain
-            chain = LLMChain(llm=self.llm, prompt=prompt)
+            # Serve repeated prompts from the response cache
+            if self._response_cache is not None:
+                cache_key = self._cache_key(prompt, system_prompt)
+                if cache_key in self._response_cache:
+                    return self._response_cache[cache_key]
             
             # Generate response
-            response = chain.run(**input_variables)
+            response = self.llm.invoke(self._to_messages(prompt, system_prompt)).content
+            
+            if self._response_cache is not None and response is not None:
+                self._response_cache[cache_key] = response
             
             return response
         except Exception as e:
-            # Log or handle specific errors
-            print(f"Error generating LLM response: {e}")
+            logger.exception("Error generating LLM response: %s", e)
             return None
     
+    def generate_responses(self, prompt_template, input_variables_list, max_concurrency=8,
+                           system_prompt=None):
+        """
+        Generate responses for several inputs to the same prompt template.
+        
+        The rendered prompts are sent to the LLM concurrently, and identical
+        prompts within the batch are only sent once.
+        
+        :param prompt_template: String template for the prompt
+        :param input_variables_list: List of dictionaries, one per prompt
+        :param max_concurrency: Maximum number of requests in flight at once
+        :param system_prompt: Optional fixed instructions shared by every prompt
+        :return: List of responses in input order; None where a prompt was empty or failed
+        """
+        responses = [None] * len(input_variables_list)
+        
+        # Map each distinct uncached prompt to the positions that need it
+        pending = {}
+        for index, input_variables in enumerate(input_variables_list):
+            try:
+                prompt = prompt_template.format(**input_variables)
+            except Exception as e:
+                logger.exception("Error rendering LLM prompt: %s", e)
+                continue
+            if not prompt.strip():
+                logger.error("Empty LLM prompt at index %d; not sending it", index)
+                continue
+            
+            if self._response_cache is not None:
+                cached = self._response_cache.get(self._cache_key(prompt, system_prompt))
+                if cached is not None:
+                    responses[index] = cached
+                    continue
+            
+            pending.setdefault(prompt, []).append(index)
+        
+        if not pending:
+            return responses
+        
+        prompts = list(pending)
+        results = self.llm.batch(
+            [self._to_messages(prompt, system_prompt) for prompt in prompts],
+            config={'max_concurrency': max_concurrency},
+            return_exceptions=True
+        )
+        
+        for prompt, result in zip(prompts, results):
+            if isinstance(result, Exception):
+                logger.error("Error generating LLM response: %s", result)
+                continue
+            
+            response = result.content
+            if self._response_cache is not None and response is not None:
+                self._response_cache[self._cache_key(prompt, system_prompt)] = response
+            
+            for index in pending[prompt]:
+                responses[index] = response
+        
+        return responses
+    
+    @staticmethod
+    def _to_messages(prompt, system_prompt):
+        """
+        Build the LLM input for a rendered prompt.
+        
+        The system message always comes first so that repeated calls share an
+        identical prefix, which provider-side prompt caching can reuse.
+        
+        :param prompt: Rendered prompt text
+        :param system_prompt: Optional system instructions
+        :return: The prompt itself, or a [system, human] message list
+        """
+        if system_prompt is None:
+            return prompt
+        return [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+    
+    @staticmethod
+    def _cache_key(prompt, system_prompt=None):
+        """
+        Digest a rendered prompt for use as a response-cache key.
+        
+        :param prompt: Rendered prompt text
+        :param system_prompt: Optional system instructions sent with the prompt
+        :return: 16-byte digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if system_prompt is not None:
+            digest.update(system_prompt.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(prompt.encode('utf-8'))
+        return digest.digest()
+    
+    def clear_cache(self):
+        """
+        Drop all cached responses.
+        """
+        if self._response_cache is not None:
+            self._response_cache.clear()
+    
     def validate_api_key(self):
         """
         Validate the API key by making a simple test call.
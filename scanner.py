@@ -1,13 +1,18 @@
+import logging
 import os
+import threading
 import pathspec
 import chardet
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Import code analyzers
 from analyzers.python_analyzer import PythonAnalyzer
 from analyzers.typescript_analyzer import TypeScriptAnalyzer
 
+logger = logging.getLogger(__name__)
+
 class RepoScanner:
     """
     A class to scan repository files while respecting gitignore rules.
@@ -24,6 +29,9 @@ class RepoScanner:
         '.md', '.rst', '.txt', '.yaml', '.yml'
     ]
     
+    # Hashed copy of SUPPORTED_EXTENSIONS for per-file membership tests
+    _SUPPORTED_EXTENSION_SET = frozenset(SUPPORTED_EXTENSIONS)
+    
     def __init__(self, repo_path: str):
         """
         Initialize the RepoScanner with a repository path.
@@ -50,6 +58,10 @@ class RepoScanner:
         # Initialize code analyzers
         self.python_analyzer = PythonAnalyzer()
         self.typescript_analyzer = TypeScriptAnalyzer()
+        
+        # Each TypeScript analysis starts a memory-heavy ts-node process, so
+        # cap how many run at once independently of the scan's thread count
+        self._typescript_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
     
     def _load_gitignore(self) -> pathspec.PathSpec:
         """
@@ -94,67 +106,103 @@ class RepoScanner:
             result = chardet.detect(raw_data)
         return result['encoding'] or 'utf-8'
     
-    def scan_files(self, max_file_size: int = 1_000_000) -> List[Dict[str, Any]]:
+    def scan_files(self, max_file_size: int = 1_000_000, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Scan repository files, respecting gitignore and file type rules.
         
+        Matching files are read and analyzed on a thread pool, since the
+        work is dominated by file I/O and analyzer subprocesses. At most
+        one TypeScript analyzer process per CPU runs at a time.
+        
         Args:
             max_file_size (int): Maximum file size in bytes to process
+            max_workers (Optional[int]): Number of worker threads (default: ThreadPoolExecutor's)
         
         Returns:
             List[Dict[str, Any]]: List of file metadata dictionaries with line number tracking
         """
-        scanned_files = []
+        candidates = []
+        
+        # Bind loop-invariant lookups once rather than per file
+        repo_path = self.repo_path
+        supported_extensions = self._SUPPORTED_EXTENSION_SET
+        is_ignored = self._is_file_ignored
         
-        for root, _, files in os.walk(self.repo_path):
+        for root, _, files in os.walk(repo_path):
+            root_path = Path(root)
             for filename in files:
-                file_path = Path(root) / filename
+                file_path = root_path / filename
                 
-                # Skip files larger than max_file_size
-                if file_path.stat().st_size > max_file_size:
+                # Skip files not matching supported extensions
+                if file_path.suffix not in supported_extensions:
                     continue
                 
-                # Skip files not matching supported extensions
-                if not any(file_path.suffix == ext for ext in self.SUPPORTED_EXTENSIONS):
+                # Skip files larger than max_file_size
+                file_size = file_path.stat().st_size
+                if file_size > max_file_size:
                     continue
                 
                 # Skip ignored files
-                if self._is_file_ignored(file_path):
+                if is_ignored(file_path):
                     continue
                 
-                try:
-                    # Detect file encoding
-                    encoding = self._detect_file_encoding(file_path)
-                    
-                    # Read file content and track line numbers
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        lines = f.readlines()
-                        content = ''.join(lines)
-                        line_numbers = list(range(1, len(lines) + 1))
-                    
-                    # Analyze file content
-                    file_metadata = {
-                        'path': str(file_path),
-                        'relative_path': str(file_path.relative_to(self.repo_path)),
-                        'size': file_path.stat().st_size,
-                        'extension': file_path.suffix,
-                        'line_count': len(lines),
-                        'line_numbers': line_numbers
-                    }
-                    
-                    # Perform language-specific analysis
-                    if file_path.suffix == '.py':
-                        file_metadata.update(self.python_analyzer.analyze(content))
-                    elif file_path.suffix in ['.ts', '.tsx', '.js', '.jsx']:
-                        file_metadata.update(self.typescript_analyzer.analyze(content))
-                    
-                    scanned_files.append({
-                        'content': content,
-                        'metadata': file_metadata
-                    })
-                
-                except Exception as e:
-                    # Log or handle file processing errors
-                    print(f"Error processing {file_path}: {e}")
+                candidates.append((file_path, file_size))
+        
+        if not candidates:
+            return []
+        
+        file_paths, file_sizes = zip(*candidates)
+        
+        # Results are collected in walk order regardless of completion order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._scan_file, file_paths, file_sizes)
+            return [result for result in results if result is not None]
+    
+    def _scan_file(self, file_path: Path, file_size: int) -> Optional[Dict[str, Any]]:
+        """
+        Read and analyze a single file.
+        
+        Args:
+            file_path (Path): Path to the file
+            file_size (int): File size in bytes, from the directory scan
+        
+        Returns:
+            Optional[Dict[str, Any]]: File content and metadata, or None if the file could not be processed
+        """
+        suffix = file_path.suffix
+        
+        try:
+            # Detect file encoding
+            encoding = self._detect_file_encoding(file_path)
+            
+            # Read file content and track line numbers
+            with open(file_path, 'r', encoding=encoding) as f:
+                lines = f.readlines()
+                content = ''.join(lines)
+                line_numbers = list(range(1, len(lines) + 1))
+            
+            # Analyze file content
+            file_metadata = {
+                'path': str(file_path),
+                'relative_path': str(file_path.relative_to(self.repo_path)),
+                'size': file_size,
+                'extension': suffix,
+                'line_count': len(lines),
+                'line_numbers': line_numbers
+            }
+            
+            # Perform language-specific analysis
+            if suffix == '.py':
+                file_metadata.update(self.python_analyzer.analyze(content))
+            elif suffix in ('.ts', '.tsx', '.js', '.jsx'):
+                with self._typescript_slots:
+                    file_metadata.update(self.typescript_analyzer.analyze(content))
+            
+            return {
+                'content': content,
+                'metadata': file_metadata
+            }
         
-        return scanned_files
+        except Exception as e:
+            logger.warning("Error processing %s: %s", file_path, e)
+            return None
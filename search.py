@@ -7,7 +7,7 @@ from config import VECTOR_STORE_MODULE
 # Import the vector store module dynamically
 vector_store_module = import_module(VECTOR_STORE_MODULE)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Represents a single search result with metadata."""
     code: str
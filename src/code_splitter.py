@@ -3,7 +3,7 @@ from typing import Dict, List, Optional, Tuple
 import ast
 import os
 
-from analyzers.python_analyzer import PythonAnalyzer
+from analyzers.python_analyzer import PythonAnalyzer, StatementVisitor
 from analyzers.base import CodeStructure
 
 class CodeSplitter:
@@ -37,18 +37,19 @@ class CodeSplitter:
         Returns:
             List of tuples containing (new_file_name, content)
         """
-        # Read and analyze the source file
+        # Read and parse the source file once; the tree is shared below
         with open(file_path, 'r', encoding='utf-8') as f:
             source = f.read()
             
-        structure = self.analyzer.analyze_code(source, str(file_path))
+        tree = self.analyzer.parse_code(source)
         
         # If file is small enough, return as is
         if len(source.splitlines()) <= self.max_file_size:
             return [(str(file_path), source)]
             
+        structure = self.analyzer.analyze_tree(tree)
+        
         # Extract original imports and code
-        tree = ast.parse(source)
         import_visitor = ImportVisitor()
         import_visitor.visit(tree)
         self.original_imports = import_visitor.imports
@@ -254,8 +255,8 @@ class CodeSplitter:
         
         return lines
 
-class ImportVisitor(ast.NodeVisitor):
-    """AST visitor to extract import statements."""
+class ImportVisitor(StatementVisitor):
+    """AST visitor to extract import statements; imports never occur inside expressions."""
     
     def __init__(self):
         self.imports = []
@@ -282,28 +283,31 @@ class ImportVisitor(ast.NodeVisitor):
 class NodeVisitor(ast.NodeVisitor):
     """Base visitor that tracks parent nodes."""
     
+    def __init__(self):
+        # Ancestors of the node being visited; kept on the visitor rather than
+        # stamped onto the nodes so the tree holds no back-references
+        self._ancestors: List[ast.AST] = []
+        
+    @property
+    def parent(self) -> Optional[ast.AST]:
+        """Parent of the node currently being visited."""
+        return self._ancestors[-2] if len(self._ancestors) > 1 else None
+    
     def visit(self, node):
-        """Visit a node and set its parent."""
-        if hasattr(node, 'parent'):
+        """Visit a node, recording it as the parent of its children."""
+        self._ancestors.append(node)
+        try:
             return super().visit(node)
-            
-        parent = getattr(self, '_parent', None)
-        node.parent = parent
-        
-        old_parent = parent
-        self._parent = node
-        super().visit(node)
-        self._parent = old_parent
-        
-        return node
+        finally:
+            self._ancestors.pop()
 
 class CodeVisitor(NodeVisitor):
     """AST visitor to extract original code blocks."""
     
     def __init__(self, source_code: str):
+        super().__init__()
         self.code_blocks = {}
         self.source_lines = source_code.split('\n')
-        self._parent = None
         
     def get_source_segment(self, node: ast.AST) -> str:
         """Get source code segment for a node."""
@@ -327,7 +331,7 @@ class CodeVisitor(NodeVisitor):
     def visit_FunctionDef(self, node: ast.FunctionDef):
         """Extract function definitions."""
         # Only store standalone functions
-        if not isinstance(getattr(node, 'parent', None), ast.ClassDef):
+        if not isinstance(self.parent, ast.ClassDef):
             source = self.get_source_segment(node)
             if source:
                 self.code_blocks[node.name] = source 
\ No newline at end of file
@@ -47,13 +47,14 @@ export class TypeScriptCodeAnalyzer {
 
         try {
             // Create source file with full parsing
-            this.sourceFile = ts.createSourceFile(
+            const sourceFile = ts.createSourceFile(
                 filePath, 
                 code, 
                 ts.ScriptTarget.Latest, 
                 true,  // Set to true to parse comments
                 ts.ScriptKind.TS  // Explicitly set script kind
             );
+            this.sourceFile = sourceFile;
 
             // Create compiler options
             const compilerOptions: ts.CompilerOptions = {
@@ -84,9 +85,26 @@ export class TypeScriptCodeAnalyzer {
             // Create a program with custom host
             const host = ts.createCompilerHost(compilerOptions);
 
+            // Serve the root file from the code given to analyzeCode. With
+            // stdin input there is no such file on disk, and the program must
+            // check the code being analyzed rather than whatever is there
+            const rootFileName = filePath.replace(/\\/g, '/');
+            const isRootFile = (fileName: string) => fileName.replace(/\\/g, '/') === rootFileName;
+
+            const originalFileExists = host.fileExists;
+            host.fileExists = (fileName: string) =>
+                isRootFile(fileName) || originalFileExists.call(host, fileName);
+
+            const originalReadFile = host.readFile;
+            host.readFile = (fileName: string) =>
+                isRootFile(fileName) ? code : originalReadFile.call(host, fileName);
+
             // Override host functions to handle library resolution
             const originalGetSourceFile = host.getSourceFile;
             host.getSourceFile = (fileName: string, languageVersion: ts.ScriptTarget) => {
+                if (isRootFile(fileName)) {
+                    return sourceFile;
+                }
                 // Handle lib files
                 if (fileName.startsWith('lib.')) {
                     const libContent = `
@@ -406,21 +424,24 @@ export class TypeScriptCodeAnalyzer {
 
 // Main execution
 if (require.main === module) {
-    // Ensure a file path is provided
+    // Ensure a file path is provided ('-' reads the code from stdin)
     if (process.argv.length < 3) {
-        console.error('Please provide a file path');
+        console.error('Please provide a file path, or - to read from stdin');
         process.exit(1);
     }
 
     const filePath = process.argv[2];
+    const fromStdin = filePath === '-';
 
     try {
-        // Read the file contents
-        const code = fs.readFileSync(filePath, 'utf-8');
+        // Read the file contents (fd 0 is stdin)
+        const code = fs.readFileSync(fromStdin ? 0 : filePath, 'utf-8');
 
         // Create and run the analyzer
         const analyzer = new TypeScriptCodeAnalyzer();
-        const result = analyzer.analyzeCode(code, filePath);
+        const result = fromStdin
+            ? analyzer.analyzeCode(code)
+            : analyzer.analyzeCode(code, filePath);
 
         // Output the result as JSON
         console.log(JSON.stringify(result, null, 2));
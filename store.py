@@ -28,34 +28,43 @@ class Store:
             metadata (Dict[str, Any]): Metadata to be added.
             file_path (str): Path of the file being analyzed.
         """
+        # Collect new rows column by column and build a single frame, instead
+        # of copying the whole DataFrame once per appended row
+        columns = {
+            'file_path': [], 'type': [], 'name': [], 'line': [],
+            'docstring': [], 'embedding': [], 'additional_info': []
+        }
+
+        def add_row(row_type: str, item: Dict[str, Any], additional_info: Dict[str, Any]):
+            docstring = item.get('docstring', '')
+            columns['file_path'].append(file_path)
+            columns['type'].append(row_type)
+            columns['name'].append(item.get('name', ''))
+            columns['line'].append(item.get('line', 0))
+            columns['docstring'].append(docstring)
+            columns['embedding'].append(self._generate_embedding(docstring))
+            columns['additional_info'].append(additional_info)
+
         # Process functions
         for func in metadata.get('functions', []):
-            self.metadata_df = self.metadata_df.append({
-                'file_path': file_path,
-                'type': 'function',
-                'name': func.get('name', ''),
-                'line': func.get('line', 0),
-                'docstring': func.get('docstring', ''),
-                'embedding': self._generate_embedding(func.get('docstring', '')),
-                'additional_info': {
-                    'args': func.get('args', []),
-                    'is_async': func.get('is_async', False)
-                }
-            }, ignore_index=True)
+            add_row('function', func, {
+                'args': func.get('args', []),
+                'is_async': func.get('is_async', False)
+            })
 
         # Process classes
         for cls in metadata.get('classes', []):
-            self.metadata_df = self.metadata_df.append({
-                'file_path': file_path,
-                'type': 'class',
-                'name': cls.get('name', ''),
-                'line': cls.get('line', 0),
-                'docstring': cls.get('docstring', ''),
-                'embedding': self._generate_embedding(cls.get('docstring', '')),
-                'additional_info': {
-                    'methods': cls.get('methods', [])
-                }
-            }, ignore_index=True)
+            add_row('class', cls, {
+                'methods': cls.get('methods', [])
+            })
+
+        if not columns['name']:
+            return
+
+        self.metadata_df = pd.concat(
+            [self.metadata_df, pd.DataFrame(columns)],
+            ignore_index=True
+        )
 
     def _generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -1,30 +1,28 @@
-import os
-import tempfile
 import pytest
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """
-    Create a temporary directory for test file operations.
+    Provide a temporary directory for test file operations.
+    
+    Backed by pytest's ``tmp_path`` so cleanup is handled by pytest.
     
     Returns:
         str: Path to the temporary directory.
     """
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield tmpdirname
+    return str(tmp_path)
 
 @pytest.fixture
-def test_file(temp_dir):
+def test_file(tmp_path):
     """
     Create a test file with initial content in the temporary directory.
     
     Args:
-        temp_dir (str): Path to the temporary directory.
+        tmp_path (Path): Path to the temporary directory.
     
     Returns:
         str: Path to the created test file.
     """
-    file_path = os.path.join(temp_dir, "test.txt")
-    with open(file_path, 'w') as f:
-        f.write("Original content")
-    return file_path
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("Original content")
+    return str(file_path)
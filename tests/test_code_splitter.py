@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from src.code_splitter import CodeSplitter
+import ast
+from src.code_splitter import CodeSplitter, CodeVisitor, ImportVisitor
 
 def test_code_splitter_init():
     """Test CodeSplitter initialization."""
@@ -205,4 +206,41 @@ class SpecialProcessor(DataProcessor[List[int]]):
     
     special = [r for r in result if "specialprocessor" in r[0].lower()][0]
     assert "class SpecialProcessor(DataProcessor[List[int]]):" in special[1]
-    assert "def _main_process" in special[1] 
\ No newline at end of file
+    assert "def _main_process" in special[1] 
+
+def test_code_visitor_leaves_tree_untouched():
+    """Test that code extraction does not attach parent links to the AST."""
+    source = "\n".join([
+        "def standalone():",
+        "    pass",
+        "",
+        "class Holder:",
+        "    def method(self):",
+        "        pass",
+    ])
+    tree = ast.parse(source)
+    
+    visitor = CodeVisitor(source)
+    visitor.visit(tree)
+    
+    assert set(visitor.code_blocks) == {'standalone', 'Holder'}
+    assert not any(hasattr(node, 'parent') for node in ast.walk(tree))
+
+def test_import_visitor_finds_nested_imports():
+    """Test that imports inside functions and guards are still collected."""
+    source = "\n".join([
+        "import os",
+        "try:",
+        "    import numpy as np",
+        "except ImportError:",
+        "    np = None",
+        "",
+        "def load():",
+        "    from json import loads",
+        "    return loads('[]')",
+    ])
+    
+    visitor = ImportVisitor()
+    visitor.visit(ast.parse(source))
+    
+    assert visitor.imports == ["import os", "import numpy as np", "from json import loads"]
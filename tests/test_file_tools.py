@@ -1,6 +1,8 @@
+import asyncio
 import os
 import pytest
-from tools import FileCreatorTool, FileEditorTool, FilePatcherTool, FilePatcherInput
+import threading
+from tools import FileBatchTool, FileCreatorTool, FileEditorTool, FilePatcherTool, FilePatcherInput
 
 class TestFileTools:
 
@@ -22,6 +24,78 @@ class TestFileTools:
         
         assert content == "Hello, World!"
 
+    def test_file_creator_bytes(self, temp_dir):
+        """
+        Test that FileCreatorTool writes encoded bytes unchanged.
+        """
+        tool = FileCreatorTool()
+        file_path = os.path.join(temp_dir, "data.bin")
+        data = "naïve\r\n".encode('utf-8') + b"\x00\xff"
+        
+        result = tool._run(file_path, data)
+        
+        assert "File created successfully" in result
+        with open(file_path, 'rb') as f:
+            assert f.read() == data
+
+    def test_file_creator_nested_directory(self, temp_dir):
+        """
+        Test that FileCreatorTool creates missing parent directories.
+        """
+        tool = FileCreatorTool()
+        file_paths = [os.path.join(temp_dir, "pkg", "sub", name) for name in ("a.py", "b.py")]
+        
+        for file_path in file_paths:
+            assert "File created successfully" in tool._run(file_path, "pass")
+        
+        assert all(os.path.exists(file_path) for file_path in file_paths)
+
+    def test_file_creator_async(self, temp_dir):
+        """
+        Test the asynchronous FileCreatorTool path.
+        """
+        tool = FileCreatorTool()
+        file_path = os.path.join(temp_dir, "async_file.txt")
+        
+        result = asyncio.run(tool._arun(file_path, "Hello, async!"))
+        
+        assert "File created successfully" in result
+        with open(file_path, 'r') as f:
+            assert f.read() == "Hello, async!"
+
+    def test_file_batch(self, temp_dir):
+        """
+        Test the FileBatchTool for creating several files at once.
+        """
+        tool = FileBatchTool()
+        operations = [
+            {"file_path": os.path.join(temp_dir, "pkg", "a.py"), "content": "a = 1"},
+            {"file_path": os.path.join(temp_dir, "b.txt"), "content": "b"},
+            {"file_path": os.path.join(temp_dir, "pkg", "c.py")},
+        ]
+        
+        result = tool._run(operations)
+        
+        assert result == "Created 3 files successfully"
+        for operation in operations:
+            with open(operation["file_path"], 'r') as f:
+                assert f.read() == operation.get("content", "")
+
+    def test_file_batch_invalid_path(self, temp_dir):
+        """
+        Test that FileBatchTool writes nothing when any path is invalid.
+        """
+        tool = FileBatchTool()
+        valid_path = os.path.join(temp_dir, "valid.txt")
+        
+        with pytest.raises(ValueError, match="Cannot create files outside the current project directory"):
+            tool._run([
+                {"file_path": valid_path, "content": "Content"},
+                {"file_path": "/absolute/path/outside/project/file.txt", "content": "Content"},
+            ])
+        
+        assert not os.path.exists(valid_path)
+
     def test_file_editor(self, test_file):
         """
         Test the FileEditorTool for editing an existing file.
@@ -37,6 +111,18 @@ class TestFileTools:
         
         assert content == "Updated content"
 
+    def test_file_editor_async(self, test_file):
+        """
+        Test the asynchronous FileEditorTool path.
+        """
+        tool = FileEditorTool()
+        
+        result = asyncio.run(tool._arun(test_file, "Updated content", backup=False))
+        
+        assert "File edited successfully" in result
+        with open(test_file, 'r') as f:
+            assert f.read() == "Updated content"
+
     def test_file_editor_backup(self, test_file):
         """
         Test the FileEditorTool's backup functionality.
@@ -56,6 +142,137 @@ class TestFileTools:
         
         assert backup_content == "Original content"
 
+    def test_file_editor_unchanged_content(self, test_file):
+        """
+        Test that re-applying the current content skips the backup and write.
+        """
+        tool = FileEditorTool()
+        mtime = os.stat(test_file).st_mtime_ns
+        
+        result = tool._run(test_file, "Original content", backup=True)
+        
+        assert "File edited successfully" in result
+        assert "no changes" in result
+        assert not os.path.exists(f"{test_file}.bak")
+        assert os.stat(test_file).st_mtime_ns == mtime
+
+    def test_file_editor_repeated_backup(self, test_file):
+        """
+        Test that each edit backs up the previous content and keeps file permissions.
+        """
+        tool = FileEditorTool()
+        os.chmod(test_file, 0o640)
+        
+        tool._run(test_file, "First edit", backup=True)
+        tool._run(test_file, "Second edit", backup=True)
+        
+        with open(f"{test_file}.bak", 'r') as f:
+            assert f.read() == "First edit"
+        with open(test_file, 'r') as f:
+            assert f.read() == "Second edit"
+        assert os.stat(test_file).st_mode & 0o777 == 0o640
+
+    def test_file_editor_backup_without_links(self, test_file, monkeypatch):
+        """
+        Test that backups fall back to a copy when hard links are unavailable.
+        """
+        def no_link(src, dst):
+            raise OSError("links not supported")
+        
+        monkeypatch.setattr(os, "link", no_link)
+        tool = FileEditorTool()
+        os.chmod(test_file, 0o640)
+        
+        tool._run(test_file, "Modified content", backup=True)
+        
+        with open(f"{test_file}.bak", 'r') as f:
+            assert f.read() == "Original content"
+        assert os.stat(f"{test_file}.bak").st_mode & 0o777 == 0o640
+
+    def test_file_editor_symlink(self, temp_dir):
+        """
+        Test that editing through a symlink updates the file it points at.
+        """
+        tool = FileEditorTool()
+        real_path = os.path.join(temp_dir, "real.txt")
+        link_path = os.path.join(temp_dir, "link.txt")
+        with open(real_path, 'w') as f:
+            f.write("old")
+        os.symlink(real_path, link_path)
+        
+        tool._run(link_path, "new", backup=True)
+        
+        assert os.path.islink(link_path)
+        with open(real_path, 'r') as f:
+            assert f.read() == "new"
+        with open(f"{link_path}.bak", 'r') as f:
+            assert f.read() == "old"
+
+    def test_file_editor_keeps_foreign_owner(self, test_file, monkeypatch):
+        """
+        Test that files which cannot be replaced are written in place.
+        """
+        import tools._io
+        monkeypatch.setattr(tools._io, "_replaceable", lambda file_stat: False)
+        tool = FileEditorTool()
+        inode = os.stat(test_file).st_ino
+        
+        tool._run(test_file, "Modified content", backup=True)
+        
+        assert os.stat(test_file).st_ino == inode
+        with open(test_file, 'r') as f:
+            assert f.read() == "Modified content"
+        with open(f"{test_file}.bak", 'r') as f:
+            assert f.read() == "Original content"
+
+    def test_file_editor_private_file_stays_private(self, test_file, monkeypatch):
+        """
+        Test that new content is never written to a file more readable than the target.
+        """
+        import tools._io
+        write_modes = []
+        original_write_content = tools._io._write_content
+        
+        def recording_write_content(fd, content, newline):
+            write_modes.append(os.fstat(fd).st_mode & 0o777)
+            original_write_content(fd, content, newline)
+        
+        monkeypatch.setattr(tools._io, "_write_content", recording_write_content)
+        os.chmod(test_file, 0o600)
+        
+        FileEditorTool()._run(test_file, "Secret content", backup=False)
+        
+        assert write_modes == [0o600]
+        assert os.stat(test_file).st_mode & 0o777 == 0o600
+
+    def test_file_editor_ignores_stale_temp_files(self, test_file):
+        """
+        Test that temp files left behind by an interrupted write do not block edits.
+        """
+        directory, name = os.path.split(test_file)
+        # Named as a crashed write from this process and thread would have left it
+        stale_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(stale_path, 'w') as f:
+            f.write("partial")
+        
+        result = FileEditorTool()._run(test_file, "Modified content", backup=False)
+        
+        assert "File edited successfully" in result
+        with open(test_file, 'r') as f:
+            assert f.read() == "Modified content"
+
+    def test_file_creator_new_file_mode(self, temp_dir):
+        """
+        Test that new files get the usual umask-based permissions.
+        """
+        umask = os.umask(0)
+        os.umask(umask)
+        file_path = os.path.join(temp_dir, "new_file.txt")
+        
+        FileCreatorTool()._run(file_path, "Content")
+        
+        assert os.stat(file_path).st_mode & 0o777 == 0o666 & ~umask
+
     def test_file_patcher(self, test_file):
         """
         Test the FilePatcherTool for applying a patch to a file.
@@ -77,6 +294,97 @@ class TestFileTools:
         
         assert content == "Patched content"
 
+    def test_file_patcher_multiple_hunks(self, temp_dir):
+        """
+        Test that FilePatcherTool applies every hunk and keeps unchanged lines.
+        """
+        tool = FilePatcherTool()
+        file_path = os.path.join(temp_dir, "module.py")
+        with open(file_path, 'w') as f:
+            f.write("import os\n\ndef a():\n    return 1\n\ndef b():\n    return 2\n")
+        
+        patch_content = """--- module.py
++++ module.py
+@@ -1,2 +1,3 @@
+ import os
++import sys
+ 
+@@ -6,2 +7,2 @@
+ def b():
+-    return 2
++    return 3
+"""
+        
+        result = tool._run(file_path, patch_content, backup=False)
+        
+        assert "File patched successfully" in result
+        with open(file_path, 'r') as f:
+            assert f.read() == "import os\nimport sys\n\ndef a():\n    return 1\n\ndef b():\n    return 3\n"
+
+    def test_file_patcher_mismatched_hunk(self, test_file):
+        """
+        Test that a patch whose context does not match leaves the file untouched.
+        """
+        tool = FilePatcherTool()
+        
+        patch_content = """@@ -1 +1 @@
+-Different content
++Patched content"""
+        
+        result = tool._run(test_file, patch_content)
+        
+        assert "does not apply" in result
+        assert not os.path.exists(f"{test_file}.bak")
+        with open(test_file, 'r') as f:
+            assert f.read() == "Original content"
+
+    def test_file_patcher_keeps_line_endings(self, temp_dir):
+        """
+        Test that patching keeps CRLF endings and form feeds in untouched lines.
+        """
+        tool = FilePatcherTool()
+        file_path = os.path.join(temp_dir, "crlf.txt")
+        with open(file_path, 'wb') as f:
+            f.write(b"a\r\nb\x0cc\r\nd\r\n")
+        
+        patch_content = """--- crlf.txt
++++ crlf.txt
+@@ -3 +3,2 @@
+-d
++D
++e
+"""
+        
+        result = tool._run(file_path, patch_content, backup=False)
+        
+        assert "File patched successfully" in result
+        with open(file_path, 'rb') as f:
+            assert f.read() == b"a\r\nb\x0cc\r\nD\r\ne\r\n"
+
+    def test_file_patcher_multiple_files(self, test_file):
+        """
+        Test that a patch covering several files is rejected.
+        """
+        tool = FilePatcherTool()
+        
+        patch_content = """--- a.txt
++++ a.txt
+@@ -1 +1 @@
+-Original content
++Patched content
+--- b.txt
++++ b.txt
+@@ -1 +1 @@
+-Original content
++Other content
+"""
+        
+        result = tool._run(test_file, patch_content)
+        
+        assert "more than one file" in result
+        with open(test_file, 'r') as f:
+            assert f.read() == "Original content"
+
     def test_file_patcher_backup(self, test_file):
         """
         Test the FilePatcherTool's backup functionality.
@@ -115,6 +423,41 @@ class TestFileTools:
         with pytest.raises(ValueError, match="Cannot create files outside the current project directory"):
             tool._run("/absolute/path/outside/project/file.txt", "Content")
 
+    def test_file_editor_invalid_path(self):
+        """
+        Test the FileEditorTool with a path outside the project directory.
+        """
+        tool = FileEditorTool()
+        
+        with pytest.raises(ValueError, match="Cannot edit files outside the current project directory"):
+            tool._run("/absolute/path/outside/project/file.txt", "Content")
+
+    def test_file_creator_path_traversal(self, temp_dir):
+        """
+        Test that relative paths climbing out of the project are rejected.
+        """
+        tool = FileCreatorTool()
+        relative_temp_path = os.path.relpath(os.path.join(temp_dir, "escaped.txt"))
+        
+        with pytest.raises(ValueError, match="potential path traversal"):
+            tool._run(relative_temp_path, "Content")
+        
+        assert not os.path.exists(os.path.join(temp_dir, "escaped.txt"))
+
+    def test_file_creator_repeated_invalid_path(self):
+        """
+        Test that retrying a rejected path fails the same way each time.
+        """
+        tool = FileCreatorTool()
+        
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Cannot create files outside the current project directory"):
+                tool._run("/outside_project/retried.txt", "Content")
+        
+        # The same path is still checked separately for other actions
+        with pytest.raises(ValueError, match="Cannot edit files outside the current project directory"):
+            FileEditorTool()._run("/outside_project/retried.txt", "Content")
+
     def test_file_editor_nonexistent_file(self, temp_dir):
         """
         Test the FileEditorTool with a non-existent file.
@@ -125,6 +468,18 @@ class TestFileTools:
         with pytest.raises(ValueError, match="File does not exist"):
             tool._run(non_existent_file, "New content")
 
+    def test_file_patcher_nonexistent_file(self, temp_dir):
+        """
+        Test the FilePatcherTool with a non-existent file.
+        """
+        tool = FilePatcherTool()
+        non_existent_file = os.path.join(temp_dir, "nonexistent.txt")
+        
+        result = tool._run(non_existent_file, "@@ -1 +1 @@\n-a\n+b")
+        
+        assert "File does not exist" in result
+        assert not os.path.exists(non_existent_file)
+
     def test_file_patcher_invalid_patch(self, test_file):
         """
         Test the FilePatcherTool with an invalid patch.
@@ -5,14 +5,20 @@ import os
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from langchain_core.language_models import FakeListChatModel
+
 from llm_wrapper import LLMWrapper
 
 class TestLLMIntegration(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the LLM wrapper for testing.
+        Set up the LLM wrapper once for all tests.
+        
+        The wrapper holds no per-test state, so the ChatOpenAI client and its
+        validation only need to be built once.
         """
-        self.llm_wrapper = LLMWrapper()
+        cls.llm_wrapper = LLMWrapper()
     
     def test_api_key_validation(self):
         """
@@ -43,5 +49,94 @@ class TestLLMIntegration(unittest.TestCase):
         response = self.llm_wrapper.generate_response("", {})
         self.assertIsNone(response, "Invalid prompt should return None")
 
+    def test_wrappers_share_chat_model(self):
+        """
+        Test that wrappers for the same model reuse one client.
+        """
+        self.assertIs(LLMWrapper().llm, self.llm_wrapper.llm)
+
+class TestLLMResponseCache(unittest.TestCase):
+    def test_identical_prompts_reuse_response(self):
+        """
+        Test that cached wrappers only call the LLM once per rendered prompt.
+        """
+        llm_wrapper = LLMWrapper(cache_responses=True)
+        llm_wrapper.llm = FakeListChatModel(responses=["first", "second", "third"])
+        
+        prompt_template = "What is the capital of {country}?"
+        
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "France"}), "first")
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "France"}), "first")
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "Spain"}), "second")
+        
+        llm_wrapper.clear_cache()
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "France"}), "third")
+
+    def test_system_prompt_is_part_of_cache_key(self):
+        """
+        Test that the same prompt under different system prompts is not shared.
+        """
+        llm_wrapper = LLMWrapper(cache_responses=True)
+        llm_wrapper.llm = FakeListChatModel(responses=["terse", "verbose"])
+        
+        prompt_template = "Describe {country}."
+        variables = {"country": "France"}
+        
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, variables, system_prompt="Be terse."), "terse")
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, variables, system_prompt="Be verbose."), "verbose")
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, variables, system_prompt="Be terse."), "terse")
+
+class TestLLMBatch(unittest.TestCase):
+    def test_batch_preserves_order_and_deduplicates(self):
+        """
+        Test that batched prompts come back in input order, sending duplicates once.
+        """
+        llm_wrapper = LLMWrapper()
+        llm_wrapper.llm = FakeListChatModel(responses=["Paris", "Madrid"])
+        
+        responses = llm_wrapper.generate_responses(
+            "What is the capital of {country}?",
+            [{"country": "France"}, {"country": "Spain"}, {"country": "France"}],
+            max_concurrency=1
+        )
+        
+        self.assertEqual(responses, ["Paris", "Madrid", "Paris"])
+    
+    def test_batch_uses_response_cache(self):
+        """
+        Test that batched prompts are served from and stored in the response cache.
+        """
+        llm_wrapper = LLMWrapper(cache_responses=True)
+        llm_wrapper.llm = FakeListChatModel(responses=["first", "second"])
+        
+        prompt_template = "What is the capital of {country}?"
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "France"}), "first")
+        
+        responses = llm_wrapper.generate_responses(
+            prompt_template,
+            [{"country": "France"}, {"country": "Spain"}]
+        )
+        
+        self.assertEqual(responses, ["first", "second"])
+        self.assertEqual(llm_wrapper.generate_response(prompt_template, {"country": "Spain"}), "second")
+    
+    def test_empty_prompts_are_not_sent(self):
+        """
+        Test that empty prompts return None without reaching the model.
+        """
+        llm_wrapper = LLMWrapper()
+        llm_wrapper.llm = FakeListChatModel(responses=["Paris"])
+        
+        self.assertIsNone(llm_wrapper.generate_response("", {}))
+        self.assertIsNone(llm_wrapper.generate_response("{text}", {"text": "  "}))
+        
+        responses = llm_wrapper.generate_responses(
+            "{text}",
+            [{"text": ""}, {"text": "What is the capital of France?"}]
+        )
+        
+        # The only response was used by the one non-empty prompt
+        self.assertEqual(responses, [None, "Paris"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -79,6 +79,37 @@ CONSTANT = "test"
         expected_variables = {'x', 'y', 'z', 'CONSTANT'}
         self.assertEqual(set(result.variables), expected_variables)
 
+    def test_analyze_nested_statements(self):
+        code = """
+try:
+    import json
+except ImportError:
+    json = None
+
+if True:
+    def guarded():
+        pass
+
+with open(__file__) as f:
+    for line in f:
+        total = len(line)
+"""
+        result = self.analyzer.analyze_code(code)
+        
+        self.assertEqual(result.imports, ['json'])
+        self.assertEqual({f['name'] for f in result.functions}, {'guarded'})
+        self.assertEqual(set(result.variables), {'json', 'total'})
+
+    def test_analyze_parsed_tree(self):
+        code = """
+import os
+
+def helper(x):
+    return x
+"""
+        tree = self.analyzer.parse_code(code)
+        self.assertEqual(self.analyzer.analyze_tree(tree), self.analyzer.analyze_code(code))
+
     def test_invalid_code(self):
         with self.assertRaises(ValueError):
             self.analyzer.analyze_code("class Invalid:")
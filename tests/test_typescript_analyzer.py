@@ -1,9 +1,13 @@
+import json
+import subprocess
 import unittest
 from analyzers import TypeScriptAnalyzer
 
 class TestTypeScriptAnalyzer(unittest.TestCase):
-    def setUp(self):
-        self.analyzer = TypeScriptAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        # The analyzer holds no per-test state, so build it once per class
+        cls.analyzer = TypeScriptAnalyzer()
 
     def test_analyze_empty_code(self):
         with self.assertRaises(ValueError):
@@ -85,5 +89,34 @@ class Incomplete {
         with self.assertRaises(ValueError):
             self.analyzer.analyze_code(invalid_code)
 
+    def _run_script_on_stdin(self, code):
+        """Run the analyzer script directly, piping the code as the Python side does."""
+        return subprocess.run(
+            [self.analyzer.npx_path, 'ts-node', self.analyzer.ts_analyzer_script, '-'],
+            input=code,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            cwd=self.analyzer.project_root,
+            env=self.analyzer.env,
+            timeout=60
+        )
+
+    def test_script_analyzes_piped_code(self):
+        result = self._run_script_on_stdin("function greet(name: string): string { return name; }")
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        functions = json.loads(result.stdout)['functions']
+        self.assertEqual([f['name'] for f in functions], ['greet'])
+
+    def test_script_checks_piped_code(self):
+        # A type error only the piped code contains; it is reported only if
+        # the compiler program checks that code rather than a file on disk
+        result = self._run_script_on_stdin("const count: number = 'one';")
+        
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("not assignable to type 'number'", result.stderr)
+        self.assertNotIn("input.ts' not found", result.stderr)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
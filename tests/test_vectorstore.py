@@ -26,12 +26,11 @@ def setup_test_env():
     else:
         del os.environ['OPENAI_API_KEY']
 
-@pytest.fixture
-def sample_documents(tmp_path):
-    """Provide comprehensive sample documents for testing."""
+def _write_sample_documents(directory: Path):
+    """Write the sample source files into ``directory`` and return them as documents."""
     # Create temporary files with sample code
-    file1_path = tmp_path / "file1.py"
-    file2_path = tmp_path / "file2.py"
+    file1_path = directory / "file1.py"
+    file2_path = directory / "file2.py"
 
     # Write sample code to files
     file1_path.write_text("""
@@ -66,6 +65,38 @@ def divide_numbers(a, b):
         }
     ]
 
+@pytest.fixture(scope="module")
+def prebuilt_store(tmp_path_factory):
+    """
+    Build the vector store for the sample documents once per module.
+
+    Embedding the documents and building the FAISS index dominates these
+    tests, so read-only search tests share this instance instead of
+    rebuilding it. Building it is what test_document_addition checks.
+    Tests that mutate the store should ``copy.deepcopy`` it.
+    """
+    sample_documents = _write_sample_documents(tmp_path_factory.mktemp("prebuilt"))
+
+    # Create a copy of documents with proper metadata structure
+    formatted_docs = []
+    for doc in sample_documents:
+        # Ensure path is set properly
+        doc_path = doc.get('path', doc['relative_path'])  # Use relative_path as fallback
+        formatted_docs.append({
+            'content': doc['content'],
+            'metadata': {
+                'path': doc_path,
+                'relative_path': doc['relative_path']
+            }
+        })
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('OPENAI_API_KEY', 'sk_test_' + 'a' * 32)
+        vector_store = CodeVectorStore()
+        vector_store.add_documents(formatted_docs)
+
+    return vector_store
+
 def test_code_processor_initialization():
     """Comprehensive test for CodeProcessor initialization."""
     logger.info("Testing CodeProcessor initialization")
@@ -146,34 +177,13 @@ def test_vector_store_initialization():
         logger.error(f"Vector store initialization failed: {e}")
         raise
 
-def test_document_addition(sample_documents):
+def test_document_addition(prebuilt_store):
     """Test adding documents to vector store."""
     logger.info("Testing document addition")
-    logger.info(f"Sample documents: {sample_documents}")
 
-    vector_store = CodeVectorStore()
+    vector_store = prebuilt_store
 
     try:
-        # Add debug print to check document paths
-        for doc in sample_documents:
-            logger.info(f"Processing document content: {doc['content'][:100]}...")  # First 100 chars
-
-        # Create a copy of documents with proper metadata structure
-        formatted_docs = []
-        for doc in sample_documents:
-            # Ensure path is set properly
-            doc_path = doc.get('path', doc['relative_path'])  # Use relative_path as fallback
-            formatted_docs.append({
-                'content': doc['content'],
-                'metadata': {
-                    'path': doc_path,
-                    'relative_path': doc['relative_path']
-                }
-            })
-            logger.info(f"Added formatted document with path: {doc_path}")
-
-        vector_store.add_documents(formatted_docs)
-
         # Verify documents were added
         assert vector_store.store is not None, "Vector store was not initialized"
         
@@ -185,12 +195,11 @@ def test_document_addition(sample_documents):
         logger.error(f"Error during document addition: {str(e)}")
         raise
 
-def test_similarity_search(sample_documents):
+def test_similarity_search(prebuilt_store):
     """Comprehensive similarity search test."""
     logger.info("Testing similarity search")
     
-    vector_store = CodeVectorStore()
-    vector_store.add_documents(sample_documents)
+    vector_store = prebuilt_store
     
     try:
         # Perform similarity search
@@ -1,10 +1,13 @@
 from .base_tool import BaseCustomTool
+from .file_batch import FileBatchTool, FileOperation
 from .file_creator import FileCreatorTool
 from .file_editor import FileEditorTool
 from .file_patcher import FilePatcherTool, FilePatcherInput
 
 __all__ = [
     'BaseCustomTool',
+    'FileBatchTool',
+    'FileOperation',
     'FileCreatorTool', 
     'FileEditorTool', 
     'FilePatcherTool',
@@ -0,0 +1,183 @@
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from typing import Optional, Set, Union
+
+# Parent directories already created by this process, so repeated writes into
+# the same tree skip the makedirs call and its per-ancestor stat calls
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+# Windows opens raw descriptors in text mode; newlines are handled by the
+# text layer, so the descriptor itself must not translate them again
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# Process umask, read once at import since reading it means setting it; new
+# files get the mode open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_file(file_path: str, content: Union[str, bytes]) -> None:
+    """
+    Write content to a file, creating its parent directory if needed.
+    
+    The file is written with atomic_write, so an interrupted write never
+    leaves a truncated file behind.
+    
+    Args:
+        file_path (str): Path to the file to write.
+        content (Union[str, bytes]): Text, or already encoded bytes, to write.
+    """
+    directory = os.path.dirname(file_path)
+    if directory and directory not in _ensured_dirs:
+        # Tools write from worker threads; create each directory only once
+        with _ensured_dirs_lock:
+            if directory not in _ensured_dirs:
+                os.makedirs(directory, exist_ok=True)
+                _ensured_dirs.add(directory)
+    
+    try:
+        atomic_write(file_path, content)
+    except FileNotFoundError:
+        # The directory was removed since it was cached; recreate it once
+        if not directory:
+            raise
+        os.makedirs(directory, exist_ok=True)
+        atomic_write(file_path, content)
+
+def backup_file(file_path: str) -> str:
+    """
+    Keep a copy of a file's current contents next to it as <file>.bak.
+    
+    The backup is a hard link where the file system allows it, which costs
+    no data copy. This relies on the file then being replaced through
+    atomic_write rather than truncated in place, which would also change
+    the linked backup, so files atomic_write cannot replace are copied.
+    
+    Args:
+        file_path (str): Path to the file to back up.
+    
+    Returns:
+        str: Path of the backup file.
+    """
+    backup_path = f"{file_path}.bak"
+    # Link the file a symlink points at, not the link itself, which
+    # atomic_write leaves in place
+    real_path = os.path.realpath(file_path)
+    try:
+        try:
+            os.unlink(backup_path)
+        except FileNotFoundError:
+            pass
+        if not _replaceable(os.stat(real_path)):
+            # atomic_write may have to write this file in place
+            raise PermissionError("file owned by another user or group")
+        os.link(real_path, backup_path)
+    except OSError:
+        # Cross-device, unsupported or unprivileged links: copy instead.
+        # copyfile copies in the kernel where the platform allows it; only
+        # the permission bits are carried over, not the timestamps
+        shutil.copyfile(file_path, backup_path)
+        shutil.copymode(file_path, backup_path)
+    return backup_path
+
+def atomic_write(file_path: str, content: Union[str, bytes],
+                 newline: Optional[str] = None) -> None:
+    """
+    Replace a file's contents atomically.
+    
+    The content is written to a temporary file in the same directory, which
+    is then renamed over the target, so readers never see a partial file.
+    Symlinks are followed, so the file they point at is replaced. An
+    existing file's permissions, owner and group are carried over; when the
+    owner or group cannot be kept, the file is written in place instead.
+    Text is encoded as UTF-8; bytes are written as they are, without a
+    text-layer round trip.
+    
+    Args:
+        file_path (str): Path to the file to write.
+        content (Union[str, bytes]): Text, or already encoded bytes, to write.
+        newline (Optional[str], optional): Newline translation for text, as
+            for open(); '' writes line endings unchanged. Defaults to None.
+    """
+    # Replace the file a symlink points at rather than the link itself
+    file_path = os.path.realpath(file_path)
+    directory, name = os.path.split(file_path)
+    
+    try:
+        target_stat = os.stat(file_path)
+    except FileNotFoundError:
+        target_stat = None
+    
+    if target_stat is not None and not _replaceable(target_stat):
+        # A new file would belong to us; write in place to keep the owner
+        _write_content(os.open(file_path, os.O_WRONLY | os.O_TRUNC | _O_BINARY), content, newline)
+        return
+    
+    # mkstemp picks an unused name, so a temp file left behind by a crash
+    # cannot block later writes, and creates it readable by the owner only
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or None)
+    try:
+        # Settle permissions and ownership before any content is written
+        try:
+            if target_stat is not None:
+                os.chmod(tmp_path, stat.S_IMODE(target_stat.st_mode))
+                if hasattr(os, 'chown'):
+                    tmp_stat = os.fstat(fd)
+                    if (tmp_stat.st_uid, tmp_stat.st_gid) != (target_stat.st_uid, target_stat.st_gid):
+                        # Setgid directories can give new files another group
+                        os.chown(tmp_path, target_stat.st_uid, target_stat.st_gid)
+            else:
+                os.chmod(tmp_path, 0o666 & ~_UMASK)
+        except BaseException:
+            os.close(fd)
+            raise
+        _write_content(fd, content, newline)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _write_content(fd: int, content: Union[str, bytes], newline: Optional[str]) -> None:
+    """
+    Write text or bytes to an open file descriptor and close it.
+    
+    Args:
+        fd (int): File descriptor opened for writing.
+        content (Union[str, bytes]): Text, encoded as UTF-8, or bytes.
+        newline (Optional[str]): Newline translation for text, as for open().
+    """
+    if isinstance(content, (bytes, bytearray)):
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+    else:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(content)
+
+def _replaceable(file_stat: os.stat_result) -> bool:
+    """
+    Check whether a file can be replaced without losing its owner or group.
+    
+    A replacement file belongs to the current user, who can only hand it to
+    a group they belong to. Root can give it any owner, and platforms
+    without POSIX ownership have nothing to keep.
+    
+    Args:
+        file_stat (os.stat_result): Result of os.stat on the file.
+    
+    Returns:
+        bool: True if atomic_write can replace the file.
+    """
+    if not hasattr(os, 'geteuid'):
+        return True
+    uid = os.geteuid()
+    if uid == 0:
+        return True
+    return file_stat.st_uid == uid and (
+        file_stat.st_gid == os.getegid() or file_stat.st_gid in os.getgroups()
+    )
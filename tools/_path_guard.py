@@ -0,0 +1,107 @@
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The tools never change directory, so resolve the project root once
+_PROJECT_DIR = os.path.abspath(os.getcwd())
+_PROJECT_PREFIX = os.path.join(_PROJECT_DIR, '')
+
+# Temp directories where tests and scratch work may write, resolved once as
+# separator-terminated prefixes for a single str.startswith check
+_TEMP_PREFIXES = tuple(sorted({
+    os.path.join(os.path.abspath(path), '')
+    for path in (
+        os.environ.get('TEMP', ''),
+        os.environ.get('TMP', ''),
+        tempfile.gettempdir()
+    )
+    if path
+}))
+
+# Rejected (file_path, action) pairs and their error messages. lru_cache does
+# not cache exceptions, and agents tend to retry the same bad path, so
+# failures are remembered here; the oldest entry is evicted when full
+_REJECTED_PATHS_MAX = 1024
+_rejected_paths: Dict[Tuple[str, str], str] = {}
+_rejected_paths_lock = threading.Lock()
+
+def validate_project_path(file_path: str, action: str) -> str:
+    """
+    Validate that a file path stays inside the project or a temp directory.
+    
+    Both accepted and rejected paths are cached per (file_path, action), so
+    tools that touch the same file repeatedly, or retry a bad path, only pay
+    for the path checks once.
+    
+    Args:
+        file_path (str): The file path to validate.
+        action (str): Verb used in the error message, e.g. "create" or "edit".
+    
+    Returns:
+        str: The validated file path.
+    
+    Raises:
+        ValueError: If the file path is invalid or potentially unsafe.
+    """
+    key = (file_path, action)
+    message = _rejected_paths.get(key)
+    if message is not None:
+        raise ValueError(message)
+    
+    try:
+        return _check_project_path(file_path, action)
+    except ValueError as e:
+        with _rejected_paths_lock:
+            if len(_rejected_paths) >= _REJECTED_PATHS_MAX:
+                del _rejected_paths[next(iter(_rejected_paths))]
+            _rejected_paths[key] = str(e)
+        raise
+
+@lru_cache(maxsize=4096)
+def _check_project_path(file_path: str, action: str) -> str:
+    """
+    Run the path checks behind validate_project_path.
+    
+    Args:
+        file_path (str): The file path to validate.
+        action (str): Verb used in the error message, e.g. "create" or "edit".
+    
+    Returns:
+        str: The validated file path.
+    
+    Raises:
+        ValueError: If the file path is invalid or potentially unsafe.
+    """
+    # Resolve against the cached project root; avoids abspath's getcwd call
+    current_dir = _PROJECT_DIR
+    abs_path = os.path.normpath(os.path.join(current_dir, file_path))
+    
+    # Detect if this is a test environment by checking for temp directory
+    is_in_temp_dir = abs_path.startswith(_TEMP_PREFIXES)
+    
+    # Detailed logging for debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Validating path: input=%s cwd=%s abs=%s in_temp=%s",
+            file_path, current_dir, abs_path, is_in_temp_dir
+        )
+    
+    # Check if the path is outside the current project directory
+    # But allow paths in the temp directory
+    is_in_project = abs_path == current_dir or abs_path.startswith(_PROJECT_PREFIX)
+    if not (is_in_project or is_in_temp_dir):
+        logger.debug("Path %s is outside current directory %s", abs_path, current_dir)
+        raise ValueError(f"Cannot {action} files outside the current project directory: {file_path}")
+    
+    # Prevent path traversal: abs_path is already normalised, so a relative
+    # path that climbs out of the project is one that resolves outside it
+    if not is_in_project and not os.path.isabs(file_path):
+        logger.debug("Path %s appears to be a path traversal attempt", abs_path)
+        raise ValueError(f"Invalid file path (potential path traversal): {file_path}")
+    
+    return file_path
@@ -1,3 +1,4 @@
+import asyncio
 from typing import ClassVar, Optional, Type
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -35,7 +36,8 @@ class BaseCustomTool(BaseTool):
         """
         Async version of _run method.
         
-        Provides an asynchronous implementation for file management tools.
+        Runs the subclass's _run in a worker thread, so blocking file I/O
+        does not stall the event loop. Subclasses only need to implement _run.
         
         Args:
             *args: Positional arguments for the tool.
@@ -43,8 +45,5 @@ class BaseCustomTool(BaseTool):
         
         Returns:
             str: A message describing the result of the operation.
-        
-        Raises:
-            NotImplementedError: If the method is not implemented by a subclass.
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        return await asyncio.to_thread(self._run, *args, **kwargs)
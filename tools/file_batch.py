@@ -0,0 +1,83 @@
+import os
+from typing import ClassVar, List, Type, Union
+from pydantic import BaseModel, Field, field_validator
+from .base_tool import BaseCustomTool
+from ._io import write_file
+from ._path_guard import validate_project_path
+
+class FileOperation(BaseModel):
+    """
+    A single file to create as part of a batch.
+    """
+    file_path: str = Field(..., description="Absolute or relative path to the file to be created")
+    content: Union[str, bytes] = Field(default="", description="Content to write to the file, as text or already encoded bytes")
+
+    @field_validator('file_path')
+    @classmethod
+    def validate_file_path(cls, file_path):
+        """
+        Validate the file path to prevent potential security risks.
+        
+        Args:
+            file_path (str): The file path to validate.
+        
+        Returns:
+            str: The validated file path.
+        
+        Raises:
+            ValueError: If the file path is invalid or potentially unsafe.
+        """
+        return validate_project_path(file_path, "create")
+
+class FileBatchInput(BaseModel):
+    """
+    Input model for FileBatchTool.
+    """
+    operations: List[FileOperation] = Field(..., description="Files to create, each with a path and content")
+
+class FileBatchTool(BaseCustomTool):
+    """
+    A tool for creating many files in one call.
+    
+    Every path is validated before anything is written, so an invalid path
+    leaves the file system untouched. Files are written grouped by directory
+    so each parent directory is created once.
+    """
+    name: ClassVar[str] = "file_batch"
+    description: ClassVar[str] = "Create several files at once from a list of paths and contents. Validates all file paths before writing."
+    args_schema: ClassVar[Type[BaseModel]] = FileBatchInput
+
+    def _run(self, operations: List[Union[FileOperation, dict]]) -> str:
+        """
+        Create all files in the batch.
+        
+        Args:
+            operations (List[Union[FileOperation, dict]]): Files to create, as
+                FileOperation models or dicts with file_path and content keys.
+        
+        Returns:
+            str: A message describing the result of the batch.
+        
+        Raises:
+            ValueError: If any file path is invalid or outside the project directory.
+        """
+        # Validate the whole batch up front
+        operations = [
+            operation if isinstance(operation, FileOperation) else FileOperation(**operation)
+            for operation in operations
+        ]
+        
+        # Group writes by directory; sorting is stable, so repeated paths keep their order
+        operations.sort(key=lambda operation: os.path.dirname(operation.file_path))
+        
+        written = 0
+        for operation in operations:
+            try:
+                write_file(operation.file_path, operation.content)
+            except PermissionError:
+                return f"Error: Insufficient permissions to create file at {operation.file_path} ({written} files created)"
+            except OSError as e:
+                return f"Error creating file: {e} ({written} files created)"
+            written += 1
+        
+        return f"Created {written} files successfully"
@@ -1,9 +1,170 @@
-import os
-import difflib
-import shutil
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+import io
+import re
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, field_validator
 from .base_tool import BaseCustomTool
+from ._io import atomic_write, backup_file
+from ._path_guard import validate_project_path
+
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+# Markers of a unified diff; a bare '+' or '-' matches almost any text
+_PATCH_MARKERS = ('@@', '+++', '---')
+
+def _split_lines(content: str) -> List[Tuple[str, str]]:
+    """
+    Split content into lines, keeping each line's own ending.
+    
+    Only '\n' ends a line, so form feeds and other characters that
+    str.splitlines() treats as line breaks stay part of the line text.
+    
+    Args:
+        content (str): Content read with newline='' so endings are untouched.
+    
+    Returns:
+        List[Tuple[str, str]]: (text, ending) pairs, where ending is '\r\n',
+        '\n', or '' for a final line without a newline.
+    """
+    lines = []
+    parts = content.split('\n')
+    tail = parts.pop()
+    for part in parts:
+        if part.endswith('\r'):
+            lines.append((part[:-1], '\r\n'))
+        else:
+            lines.append((part, '\n'))
+    if tail:
+        lines.append((tail, ''))
+    return lines
+
+def _apply_unified_diff(original: str, patch_content: str) -> str:
+    """
+    Apply the hunks of a unified diff to a file's content.
+    
+    Hunks must match the original exactly at the line numbers given in their
+    headers. Anything before the first hunk is ignored, but a patch with
+    headers for more than one file is rejected. Unchanged lines keep their
+    line endings; added lines use the ending of the file's first line.
+    
+    Args:
+        original (str): Current content of the file, read with newline=''.
+        patch_content (str): Patch in unified diff format.
+    
+    Returns:
+        str: The patched content.
+    
+    Raises:
+        ValueError: If the patch has no hunks, covers several files, or a
+            hunk does not apply.
+    """
+    source_lines = _split_lines(original)
+    trailing_newline = original.endswith('\n') or not original
+    newline = source_lines[0][1] if source_lines and source_lines[0][1] else '\n'
+    
+    result = []
+    position = 0
+    hunk_count = 0
+    file_headers = 0
+    # Stream the patch rather than splitting it into a list up front;
+    # universal newline mode splits on \n, \r\n and \r alike
+    patch_lines = (line.rstrip('\n') for line in io.StringIO(patch_content, newline=None))
+    
+    # A line read past the end of a hunk, to be examined as a possible header
+    pending = None
+    while True:
+        line = pending if pending is not None else next(patch_lines, None)
+        pending = None
+        if line is None:
+            break
+        
+        # A ---/+++ pair outside a hunk starts the changes for one file
+        if line.startswith('---'):
+            following = next(patch_lines, None)
+            if following is not None and following.startswith('+++'):
+                file_headers += 1
+                if file_headers > 1:
+                    raise ValueError("Patch changes more than one file; patch one file at a time")
+            else:
+                pending = following
+            continue
+        
+        header = _HUNK_HEADER.match(line)
+        if not header:
+            continue
+        
+        hunk_count += 1
+        old_start = int(header.group(1))
+        old_count = int(header.group(2) or 1)
+        new_count = int(header.group(4) or 1)
+        
+        # Collect the hunk body; the header counts say where it ends
+        body = []
+        old_lines, new_lines = [], []
+        old_eof_marker = new_eof_marker = False
+        last_kind = None
+        complete = old_count == 0 and new_count == 0
+        for body_line in patch_lines:
+            kind, text = (body_line[:1] or ' '), body_line[1:]
+            if complete and kind != '\\':
+                pending = body_line
+                break
+            if kind == '\\':
+                # "\ No newline at end of file" applies to the previous line
+                if last_kind in (' ', '-'):
+                    old_eof_marker = True
+                if last_kind in (' ', '+'):
+                    new_eof_marker = True
+            elif kind in (' ', '-', '+'):
+                body.append((kind, text))
+                if kind != '+':
+                    old_lines.append(text)
+                if kind != '-':
+                    new_lines.append(text)
+            else:
+                raise ValueError(f"Malformed line in hunk {hunk_count}: {body_line!r}")
+            last_kind = kind
+            complete = len(old_lines) >= old_count and len(new_lines) >= new_count
+        
+        if len(old_lines) != old_count or len(new_lines) != new_count:
+            raise ValueError(f"Hunk {hunk_count} does not match its header line counts")
+        
+        # A zero-length old range inserts after line old_start
+        start = old_start if old_count == 0 else old_start - 1
+        if (start < position
+                or [text for text, _ in source_lines[start:start + old_count]] != old_lines):
+            raise ValueError(f"Hunk {hunk_count} does not apply at line {old_start}")
+        
+        result.extend(source_lines[position:start])
+        # Context lines are taken from the file so they keep their endings
+        index = start
+        for kind, text in body:
+            if kind == ' ':
+                result.append(source_lines[index])
+            elif kind == '+':
+                result.append((text, newline))
+            if kind != '+':
+                index += 1
+        position = start + old_count
+        
+        # Only an explicit marker on the hunk touching the end changes the final newline
+        if position == len(source_lines):
+            if new_eof_marker:
+                trailing_newline = False
+            elif old_eof_marker:
+                trailing_newline = True
+    
+    if not hunk_count:
+        raise ValueError("No hunks found in patch")
+    
+    result.extend(source_lines[position:])
+    if not result:
+        return ''
+    
+    # Every line but the last ends with a newline; the last one only if the
+    # patched file should end with one
+    last_text, last_ending = result.pop()
+    content = ''.join(text + (ending or newline) for text, ending in result)
+    return content + last_text + ((last_ending or newline) if trailing_newline else '')
 
 class FilePatcherInput(BaseModel):
     """
@@ -13,7 +174,8 @@ class FilePatcherInput(BaseModel):
     patch_content: str = Field(..., description="Patch content in unified diff format")
     backup: Optional[bool] = Field(default=True, description="Create a backup of the original file")
 
-    @validator('file_path')
+    @field_validator('file_path')
+    @classmethod
     def validate_file_path(cls, file_path):
         """
         Validate the file path to prevent potential security risks.
@@ -27,25 +189,11 @@ class FilePatcherInput(BaseModel):
         Raises:
             ValueError: If the file path is invalid or potentially unsafe.
         """
-        # Prevent absolute paths outside of current project
-        if os.path.isabs(file_path):
-            current_dir = os.path.abspath(os.getcwd())
-            abs_path = os.path.abspath(file_path)
-            if not abs_path.startswith(current_dir):
-                raise ValueError(f"Cannot patch files outside the current project directory: {file_path}")
-        
-        # Prevent path traversal
-        normalized_path = os.path.normpath(file_path)
-        if normalized_path.startswith('..'):
-            raise ValueError(f"Invalid file path (potential path traversal): {file_path}")
-        
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise ValueError(f"File does not exist: {file_path}")
-        
-        return file_path
+        # Existence is checked when the tool opens the file, not here
+        return validate_project_path(file_path, "patch")
 
-    @validator('patch_content')
+    @field_validator('patch_content')
+    @classmethod
     def validate_patch_content(cls, patch_content):
         """
         Validate the patch content format.
@@ -63,15 +211,18 @@ class FilePatcherInput(BaseModel):
         if not patch_content or not isinstance(patch_content, str):
             raise ValueError("Invalid patch content format. Patch content cannot be empty.")
         
-        # Remove whitespace
-        stripped_content = patch_content.strip()
+        # Remove whitespace, skipping the copy when there is none at either end
+        if patch_content[0].isspace() or patch_content[-1].isspace():
+            stripped_content = patch_content.strip()
+        else:
+            stripped_content = patch_content
         
         # Check for minimum characteristics of a valid patch
         if len(stripped_content) < 10:
             raise ValueError("Invalid patch content format. Patch content is too short.")
         
         # Ensure the patch contains typical patch indicators
-        if not any(indicator in stripped_content for indicator in ['---', '+++', '@@', '+', '-']):
+        if not any(marker in stripped_content for marker in _PATCH_MARKERS):
             raise ValueError("Invalid patch content format. Missing patch indicators.")
         
         return patch_content
@@ -98,46 +249,26 @@ class FilePatcherTool(BaseCustomTool):
         """
         try:
             # Read original file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_lines = f.readlines()
+            # newline='' keeps each line's ending, so CRLF files stay CRLF
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                original_content = f.read()
+            
+            # Apply the patch before touching the file, so a bad patch changes nothing
+            new_content = _apply_unified_diff(original_content, patch_content)
             
             # Create backup if requested
             if backup:
-                backup_path = f"{file_path}.bak"
-                shutil.copy2(file_path, backup_path)
-            
-            # Extract the new content from the patch
-            new_content = None
-            for line in patch_content.split('\n'):
-                if line.startswith('+') and not line.startswith('+++'):
-                    new_content = line[1:].strip()
-                    break
-            
-            if new_content is None:
-                raise ValueError("No new content found in patch")
+                backup_file(file_path)
             
             # Write patched content back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            atomic_write(file_path, new_content, newline='')
             
             backup_msg = " (with backup)" if backup else ""
             return f"File patched successfully at {file_path}{backup_msg}"
         
+        except FileNotFoundError:
+            return f"Error: File does not exist: {file_path}"
         except PermissionError:
             return f"Error: Insufficient permissions to patch file at {file_path}"
         except (OSError, ValueError) as e:
             return f"Error patching file: {e}"
-
-    async def _arun(self, file_path: str, patch_content: str, backup: bool = True) -> str:
-        """
-        Asynchronous version of file patching.
-        
-        Args:
-            file_path (str): Path to the file to be patched.
-            patch_content (str): Patch content in unified diff format.
-            backup (bool, optional): Whether to create a backup of the original file. Defaults to True.
-        
-        Returns:
-            str: A message describing the result of the patch operation.
-        """
-        return self._run(file_path, patch_content, backup)
@@ -1,6 +1,7 @@
 import os
 from typing import List, Dict, Optional, Any
 from pathlib import Path
+from dataclasses import fields, is_dataclass
 import logging
 
 from langchain_community.vectorstores import FAISS
@@ -103,7 +104,11 @@ class CodeProcessor:
         # Update with additional metadata if provided
         if metadata:
             # If metadata is a CodeStructure object, convert it to a dictionary
-            if hasattr(metadata, '__dict__'):
+            if is_dataclass(metadata):
+                base_metadata.update(
+                    (f.name, getattr(metadata, f.name)) for f in fields(metadata)
+                )
+            elif hasattr(metadata, '__dict__'):
                 base_metadata.update(metadata.__dict__)
             else:
                 base_metadata.update(metadata)